@@ -69,7 +69,9 @@ class FrozenDict(Mapping[K, V]):
   def __getitem__(self, key):
     v = self._dict[key]
     if isinstance(v, dict):
-      return FrozenDict(v)
+      # the internal state is never mutated so sub-trees can be shared
+      # with the returned FrozenDict instead of deep copied.
+      return FrozenDict(v, __unsafe_skip_copy__=True)
     return v
 
   def __setitem__(self, key, value):
@@ -191,8 +193,22 @@ def _prepare_freeze(xs: Any) -> Any:
   if not isinstance(xs, dict):
     # return a leaf as is.
     return xs
-  # recursively copy dictionary to avoid ref sharing
-  return {key: _prepare_freeze(val) for key, val in xs.items()}
+  # copy nested dictionaries to avoid ref sharing, using an explicit stack
+  # instead of recursion to avoid a Python call per node.
+  root: dict[Any, Any] = {}
+  stack = [(root, xs)]
+  while stack:
+    target, source = stack.pop()
+    for key, value in source.items():
+      if isinstance(value, dict):
+        # insert the copy right away to preserve the key order.
+        target[key] = new_value = {}
+        stack.append((new_value, value))
+      elif isinstance(value, FrozenDict):
+        target[key] = value._dict  # pylint: disable=protected-access
+      else:
+        target[key] = value
+  return root
 
 
 def freeze(xs: Mapping[Any, Any]) -> FrozenDict[Any, Any]:
@@ -205,6 +221,9 @@ def freeze(xs: Mapping[Any, Any]) -> FrozenDict[Any, Any]:
   Returns:
     The frozen dictionary.
   """
+  if isinstance(xs, FrozenDict):
+    # FrozenDicts are immutable so there is nothing to copy.
+    return xs
   return FrozenDict(xs)
 
 
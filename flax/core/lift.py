@@ -1513,10 +1513,7 @@ def _hashable_filter(x):
     return (x,)
   if isinstance(x, Iterable):
     return tuple(x)  # convert un-hashable list & sets to tuple
-  if isinstance(x, DenyList):
-    return DenyList(
-      _hashable_filter(x.deny)
-    )  # convert inner filter recursively
+  # DenyList stores collection filters as a frozenset so it is hashable as is.
   return x
 
 
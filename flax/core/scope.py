@@ -66,7 +66,7 @@ Filter = Union[bool, str, typing.Collection[str], 'DenyList']
 # pylint: disable=g-bool-id-comparison
 
 
-@dataclasses.dataclass(frozen=True, eq=True)
+@dataclasses.dataclass(frozen=True, eq=True, slots=True)
 class DenyList:
   """DenyList represents an opt-out based mutability filter.
   DenyList can be used to make every collection mutable except the ones
@@ -75,22 +75,46 @@ class DenyList:
     nn.apply(fn, mutable=nn.DenyList(["params"]))
   Attributes:
     deny: The filter representing the collections that are not mutable.
+      Collections of names are stored as a ``frozenset`` such that DenyLists
+      are hashable and compare equal regardless of the order of the names, so
+      ``deny`` does not return the list or tuple that was passed in.
   """
 
   deny: Filter
 
+  def __post_init__(self):
+    # Store collection filters as a frozenset so that set algebra on the
+    # DenyList doesn't need to rebuild a set on every call.
+    if isinstance(self.deny, typing.Collection) and not isinstance(
+      self.deny, str
+    ):
+      object.__setattr__(self, 'deny', _as_frozenset(self.deny))
+
+  def _sort_key(self) -> str:
+    # frozensets iterate in an order that depends on the string hash seed, so
+    # the names are sorted to order DenyLists the same way in every process.
+    if isinstance(self.deny, frozenset):
+      return str(sorted(self.deny))
+    return str(self.deny)
+
+  def __repr__(self):
+    if isinstance(self.deny, frozenset) and self.deny:
+      names = ', '.join(repr(name) for name in sorted(self.deny))
+      return f'DenyList(deny=frozenset({{{names}}}))'
+    return f'DenyList(deny={self.deny!r})'
+
   def __lt__(self, other):
     if isinstance(other, str):
       return False
     if isinstance(other, DenyList):
-      return str(self.deny) < str(other.deny)
+      return self._sort_key() < other._sort_key()
     return NotImplemented
 
   def __gt__(self, other):
     if isinstance(other, str):
       return True
     if isinstance(other, DenyList):
-      return str(self.deny) > str(other.deny)
+      return self._sort_key() > other._sort_key()
     return NotImplemented
 
 
@@ -112,6 +136,10 @@ class LazyRng(struct.PyTreeNode):
     rng: Union['LazyRng', PRNGKey], *suffix: PRNGFoldable
   ) -> 'LazyRng':
     if isinstance(rng, LazyRng):
+      if not suffix:
+        # LazyRng is immutable so it can be shared, e.g. when a child Scope
+        # re-wraps the rngs it received from `Scope.push`.
+        return rng
       return LazyRng(rng.rng, rng.suffix + suffix)
     else:
       return LazyRng(rng, suffix)
@@ -121,6 +149,10 @@ class LazyRng(struct.PyTreeNode):
     return LazyRng(key, ())
 
 
+def _as_frozenset(x: typing.Collection[str]) -> frozenset[str]:
+  return x if isinstance(x, frozenset) else frozenset(x)
+
+
 def _fold_in_static(
   rng: PRNGKey, data: typing.Collection[PRNGFoldable]
 ) -> PRNGKey:
@@ -193,6 +225,10 @@ def in_filter(filter_like: Filter, col: str) -> bool:
     True if either `filter_like` is True, equal to `col`, or a sequence
     containing `col`.
   """
+  in_filter_fn = _IN_FILTER_DISPATCH.get(type(filter_like))
+  if in_filter_fn is not None:
+    return in_filter_fn(filter_like, col)
+  # slow path for subclasses and other collection types
   if isinstance(filter_like, str):
     return col == filter_like
   if isinstance(filter_like, typing.Collection):
@@ -204,22 +240,39 @@ def in_filter(filter_like: Filter, col: str) -> bool:
   raise errors.InvalidFilterError(filter_like)
 
 
-def filter_to_set(x: Filter) -> set[str]:
+def _in_collection(filter_like: typing.Collection[str], col: str) -> bool:
+  return col in filter_like
+
+
+# Maps the exact type of a filter to its membership test so the common filter
+# types avoid the isinstance chain in `in_filter`.
+_IN_FILTER_DISPATCH: dict[type, Callable[[Any, str], bool]] = {
+  bool: lambda filter_like, col: filter_like,
+  str: lambda filter_like, col: col == filter_like,
+  list: _in_collection,
+  tuple: _in_collection,
+  set: _in_collection,
+  frozenset: _in_collection,
+  DenyList: lambda filter_like, col: not in_filter(filter_like.deny, col),
+}
+
+
+def filter_to_set(x: Filter) -> frozenset[str]:
   """Converts a Filter into a set of collections, fails on the infinite set.
 
   Args:
     x: a filter (boolean, string, or list of strings).
 
   Returns:
-    The input filter represented as a set of strings.
+    The input filter represented as a frozenset of strings.
   """
   assert x is not True and not isinstance(x, DenyList), 'Infinite set'
   if x is False:
-    return set()
+    return frozenset()
   if isinstance(x, str):
-    return {x}
+    return frozenset((x,))
   if isinstance(x, typing.Collection):
-    return set(x)
+    return _as_frozenset(x)
   raise errors.InvalidFilterError(x)
 
 
@@ -232,7 +285,7 @@ def union_filters(a: Filter, b: Filter) -> Filter:
 
   Returns:
     The union of the two input filters. For instance,
-    `union_filters('f1', ['f2']) = {'f1', 'f2'}`.
+    `union_filters('f1', ['f2']) = frozenset({'f1', 'f2'})`.
   """
   if a is True or b is True:
     return True
@@ -243,9 +296,7 @@ def union_filters(a: Filter, b: Filter) -> Filter:
   if isinstance(a, DenyList):
     return DenyList(subtract_filters(a.deny, b))
 
-  a = filter_to_set(a)
-  b = filter_to_set(b)
-  return a.union(b)
+  return filter_to_set(a) | filter_to_set(b)
 
 
 def subtract_filters(a: Filter, b: Filter) -> Filter:
@@ -268,9 +319,7 @@ def subtract_filters(a: Filter, b: Filter) -> Filter:
     return DenyList(union_filters(a.deny, b))
   if isinstance(b, DenyList):
     return intersect_filters(a, b.deny)
-  a = filter_to_set(a)
-  b = filter_to_set(b)
-  return a - b
+  return filter_to_set(a) - filter_to_set(b)
 
 
 def intersect_filters(a: Filter, b: Filter) -> Filter:
@@ -282,7 +331,7 @@ def intersect_filters(a: Filter, b: Filter) -> Filter:
 
   Returns:
     The intersection of the two input filters. For instance,
-    `intersect_filters('f1', ['f1', 'f2']) = {'f1'}`.
+    `intersect_filters('f1', ['f1', 'f2']) = frozenset({'f1'})`.
   """
   if a is True:
     return b
@@ -294,9 +343,7 @@ def intersect_filters(a: Filter, b: Filter) -> Filter:
     b, a = a, b
   if isinstance(a, DenyList):
     return subtract_filters(b, a.deny)
-  a = filter_to_set(a)
-  b = filter_to_set(b)
-  return a.intersection(b)
+  return filter_to_set(a) & filter_to_set(b)
 
 
 def group_collections(
@@ -316,19 +363,36 @@ def group_collections(
     A sequence S with `len(S) == len(col_filters)`. Each `S[i]` is the result of
     applying filter `col_filters[i]` to the remaining keys in `xs`.
   """
-  cols: Iterable[str]
-  cols = xs.keys()
-  groups = []
-  for col_filter in col_filters:
-    remaining_cols = []
-    group = {}
-    for col in cols:
-      if in_filter(col_filter, col):
-        group[col] = jax.tree_util.tree_map(lambda x: x, xs[col])
-      else:
-        remaining_cols.append(col)
-    cols = remaining_cols
-    groups.append(group)
+  # Encode, for every collection, the set of filters accepting it as a
+  # bitmask. This way `xs` is visited only once regardless of the number of
+  # filters, and each collection goes to the first (lowest bit) filter.
+  true_mask = 0
+  name_masks: dict[str, int] = {}
+  deny_lists: list[tuple[int, DenyList]] = []
+  for i, col_filter in enumerate(col_filters):
+    bit = 1 << i
+    if isinstance(col_filter, bool):
+      if col_filter:
+        true_mask |= bit
+    elif isinstance(col_filter, str):
+      name_masks[col_filter] = name_masks.get(col_filter, 0) | bit
+    elif isinstance(col_filter, typing.Collection):
+      for col in col_filter:
+        name_masks[col] = name_masks.get(col, 0) | bit
+    elif isinstance(col_filter, DenyList):
+      deny_lists.append((bit, col_filter))
+    else:
+      raise errors.InvalidFilterError(col_filter)
+
+  groups: list[MutableVariableDict] = [{} for _ in col_filters]
+  for col, value in xs.items():
+    mask = true_mask | name_masks.get(col, 0)
+    for bit, deny_list in deny_lists:
+      if in_filter(deny_list, col):
+        mask |= bit
+    if mask:
+      index = (mask & -mask).bit_length() - 1
+      groups[index][col] = jax.tree_util.tree_map(lambda x: x, value)
   return tuple(groups)
 
 
@@ -423,6 +487,23 @@ class Scope:
   for a number of examples using ``Scopes``.
   """
 
+  __slots__ = (
+    '_variables',
+    'parent',
+    'name',
+    'path',
+    'debug_path',
+    'rngs',
+    'mutable',
+    'flags',
+    '_root',
+    'trace_level',
+    'rng_counters',
+    'reservations',
+    '_invalid',
+    '__weakref__',
+  )
+
   reservations: dict[str, set[str | None]]
 
   def __init__(
@@ -749,15 +830,18 @@ class Scope:
 
   def make_rng(self, name: str = 'params') -> PRNGKey:
     """Generates A PRNGKey from a PRNGSequence with name `name`."""
-    if not self.has_rng(name):
-      if self.has_rng('params'):
-        name = 'params'
-      else:
+    rngs = self.rngs
+    if name not in rngs:
+      if 'params' not in rngs:
         raise errors.InvalidRngError(f'{self.name} needs PRNG for "{name}"')
+      name = 'params'
     self._check_valid()
     self._validate_trace_level()
-    self.rng_counters[name] += 1
-    return LazyRng.create(self.rngs[name], self.rng_counters[name]).as_jax_rng()
+    counter = self.rng_counters[name] + 1
+    self.rng_counters[name] = counter
+    # fold in directly instead of creating a temporary LazyRng.
+    rng = rngs[name]
+    return _fold_in_static(rng.rng, rng.suffix + (counter,))
 
   def get_variable(self, col: str, name: str, default: Any = None) -> Any:
     """Retrieves the value of a Variable.
@@ -1212,20 +1296,25 @@ def _is_valid_rng(rng: Array):
     return rng.shape == ()
 
   # Handle old-style raw PRNG keys
-  expected_rng = jax.eval_shape(
-    lambda s: jax.random.key_data(jax.random.key(s)), 0
-  )
+  expected_rng = _raw_rng_shape_dtype(jax.config.jax_default_prng_impl)
   if (rng.shape, rng.dtype) != (expected_rng.shape, expected_rng.dtype):
     return False
   return True
 
 
+@functools.lru_cache
+def _raw_rng_shape_dtype(prng_impl: str) -> jax.ShapeDtypeStruct:
+  """Returns the shape and dtype of raw keys of the default PRNG implementation.
+
+  Cached per implementation name so validating rngs doesn't trace on every call.
+  """
+  del prng_impl  # only used as the cache key
+  return jax.eval_shape(lambda s: jax.random.key_data(jax.random.key(s)), 0)
+
+
 def _is_valid_rngs(rngs: PRNGKey | RNGSequences):
   if not isinstance(rngs, (FrozenDict, dict)):
     return False
-  for key, val in rngs.items():
-    if not isinstance(key, str):
-      return False
-    if not _is_valid_rng(val):
-      return False
-  return True
+  return all(
+    isinstance(key, str) and _is_valid_rng(val) for key, val in rngs.items()
+  )
@@ -48,22 +48,67 @@ class Template(FlaxError):
     super().__init__(f'')
 """
 
+import abc
+
+
+def _add_error_page(cls: type, message: str) -> str:
+  error_page = (
+    'https://flax.readthedocs.io/en/latest/api_reference/flax.errors.html'
+  )
+  module_name = cls.__module__
+  class_name = cls.__name__
+  if error_page not in message: # do not add a FlaxError link on unpickling
+    message = f'{message} ({error_page}#{module_name}.{class_name})'
+  return message
+
 
 class FlaxError(Exception):
   def __init__(self, message):
-    error_page = (
-      'https://flax.readthedocs.io/en/latest/api_reference/flax.errors.html'
-    )
-    module_name = self.__class__.__module__
-    class_name = self.__class__.__name__
-    if error_page not in message: # do not add a FlaxError link on unpickling
-      message = f'{message} ({error_page}#{module_name}.{class_name})'
-    super().__init__(message)
+    super().__init__(_add_error_page(self.__class__, message))
 
   def __reduce__(self):
    return (FlaxError, (str(self),))
 
 
+class _LazyFlaxError(FlaxError):
+  """A FlaxError that only formats its message when it is displayed.
+
+  Used for errors that are commonly raised and caught without ever being
+  displayed. Subclasses store their arguments and implement ``_message``,
+  which is formatted on first access of ``args`` (or ``str``/``repr``).
+  """
+
+  def __init__(self):
+    Exception.__init__(self)  # pylint: disable=non-parent-init-called
+    self._formatted = False
+
+  @abc.abstractmethod
+  def _message(self) -> str:
+    """Returns the error message without the error page link."""
+
+  def _format(self):
+    if not self._formatted:
+      self.args = (_add_error_page(self.__class__, self._message()),)
+
+  @property
+  def args(self):
+    self._format()
+    return BaseException.args.__get__(self)
+
+  @args.setter
+  def args(self, value):
+    BaseException.args.__set__(self, value)
+    self._formatted = True
+
+  def __str__(self):
+    self._format()
+    return super().__str__()
+
+  def __repr__(self):
+    self._format()
+    return super().__repr__()
+
+
 #################################################
 # NNX errors                                    #
 #################################################
@@ -202,7 +247,7 @@ class ApplyScopeInvalidVariablesStructureError(FlaxError):
     )
 
 
-class ScopeParamNotFoundError(FlaxError):
+class ScopeParamNotFoundError(_LazyFlaxError):
   """This error is thrown when trying to access a parameter that does not exist.
 
   For instance, in the code below, the initialized embedding name 'embedding'
@@ -226,9 +271,14 @@ class ScopeParamNotFoundError(FlaxError):
   """
 
   def __init__(self, param_name, scope_path):
-    super().__init__(
-      f'Could not find parameter named "{param_name}" in scope '
-      f'"{scope_path}".'
+    self.param_name = param_name
+    self.scope_path = scope_path
+    super().__init__()
+
+  def _message(self):
+    return (
+      f'Could not find parameter named "{self.param_name}" in scope '
+      f'"{self.scope_path}".'
     )
 
 
@@ -253,7 +303,7 @@ class ScopeCollectionNotFound(FlaxError):
     )
 
 
-class ScopeParamShapeError(FlaxError):
+class ScopeParamShapeError(_LazyFlaxError):
   """This error is thrown when the shape of an existing parameter is different from
 
   the shape of the return value of the ``init_fn``. This can happen when the
@@ -282,10 +332,17 @@ class ScopeParamShapeError(FlaxError):
   """
 
   def __init__(self, param_name, scope_path, value_shape, init_shape):
-    super().__init__(
-        f'For parameter "{param_name}" in "{scope_path}", the given '
-        f'initializer is expected to generate shape {init_shape}, but the '
-        f'existing parameter it received has shape {value_shape}.'
+    self.param_name = param_name
+    self.scope_path = scope_path
+    self.value_shape = value_shape
+    self.init_shape = init_shape
+    super().__init__()
+
+  def _message(self):
+    return (
+        f'For parameter "{self.param_name}" in "{self.scope_path}", the given '
+        f'initializer is expected to generate shape {self.init_shape}, but the '
+        f'existing parameter it received has shape {self.value_shape}.'
     )
 
 
@@ -324,7 +381,7 @@ class InvalidScopeError(FlaxError):
     super().__init__(f'The scope "{scope_name}" is no longer valid.')
 
 
-class ModifyScopeVariableError(FlaxError):
+class ModifyScopeVariableError(_LazyFlaxError):
   """You cannot update a variable if the collection it belongs to is immutable.
 
   When you are applying a Module, you should specify which variable collections
@@ -345,9 +402,15 @@ class ModifyScopeVariableError(FlaxError):
   """
 
   def __init__(self, col, variable_name, scope_path):
-    super().__init__(
-      f'Cannot update variable "{variable_name}" in '
-      f'"{scope_path}" because collection "{col}" is immutable.'
+    self.col = col
+    self.variable_name = variable_name
+    self.scope_path = scope_path
+    super().__init__()
+
+  def _message(self):
+    return (
+      f'Cannot update variable "{self.variable_name}" in '
+      f'"{self.scope_path}" because collection "{self.col}" is immutable.'
     )
 
 
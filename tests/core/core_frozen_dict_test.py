@@ -26,6 +26,24 @@ class FrozenDictTest(parameterized.TestCase):
     xs['b']['c'] += 1
     self.assertEqual(unfreeze(frozen), {'a': 1, 'b': {'c': 2}})
 
+  def test_frozen_dict_shares_frozen_state(self):
+    frozen = freeze({'a': 1, 'b': {'c': {'d': 2}}})
+    self.assertIs(freeze(frozen), frozen)
+    # nested FrozenDicts reference the sub-trees instead of copying them.
+    self.assertIs(frozen['b']._dict['c'], frozen._dict['b']['c'])
+
+  def test_frozen_dict_deeply_nested(self):
+    xs = leaf = {}
+    for _ in range(5000):
+      leaf['a'] = {}
+      leaf = leaf['a']
+    leaf['b'] = 1
+    frozen = freeze(xs)
+    leaf['b'] = 2
+    for _ in range(5000):
+      frozen = frozen['a']
+    self.assertEqual(frozen['b'], 1)
+
   def test_frozen_dict_maps(self):
     xs = {'a': 1, 'b': {'c': 2}}
     frozen = FrozenDict(xs)
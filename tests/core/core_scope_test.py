@@ -20,7 +20,7 @@ from jax import random
 
 from flax import errors
 from flax import config
-from flax.core import Scope, apply, freeze, init, lazy_init, nn, scope
+from flax.core import Scope, apply, freeze, init, lazy_init, lift, nn, scope
 from flax.core.scope import LazyRng
 
 
@@ -54,9 +54,9 @@ class ScopeTest(absltest.TestCase):
       self.assertEqual(scope.union_filters(a, b), ans)
       self.assertEqual(scope.union_filters(b, a), ans)
 
-    union_check(['a', 'b'], ['b', 'c'], {'a', 'b', 'c'})
+    union_check(['a', 'b'], ['b', 'c'], frozenset({'a', 'b', 'c'}))
     union_check(True, False, True)
-    union_check(False, False, set())
+    union_check(False, False, frozenset())
     union_check(True, True, True)
     union_check(
       scope.DenyList(['a', 'b']),
@@ -72,28 +72,30 @@ class ScopeTest(absltest.TestCase):
       self.assertEqual(scope.intersect_filters(a, b), ans)
       self.assertEqual(scope.intersect_filters(b, a), ans)
 
-    intersect_check(['a', 'b'], ['b', 'c'], {'b'})
+    intersect_check(['a', 'b'], ['b', 'c'], frozenset({'b'}))
     intersect_check(True, False, False)
-    intersect_check(False, False, set())
+    intersect_check(False, False, frozenset())
     intersect_check(True, True, True)
     intersect_check(
       scope.DenyList(['a', 'b']),
       scope.DenyList(['b', 'c']),
       scope.DenyList({'a', 'b', 'c'}),
     )
-    intersect_check(scope.DenyList(['a', 'b']), ['b', 'c'], {'c'})
+    intersect_check(
+      scope.DenyList(['a', 'b']), ['b', 'c'], frozenset({'c'})
+    )
 
   def test_subtract_filter(self):
     def subtract_check(a, b, ans):
       self.assertEqual(scope.subtract_filters(a, b), ans)
 
-    subtract_check(['a', 'b'], ['b', 'c'], {'a'})
+    subtract_check(['a', 'b'], ['b', 'c'], frozenset({'a'}))
     subtract_check(True, False, scope.DenyList(False))
-    subtract_check(False, False, set())
+    subtract_check(False, False, frozenset())
     subtract_check(True, True, False)
     subtract_check(True, 'a', scope.DenyList('a'))
     subtract_check(
-      scope.DenyList(['a', 'b']), scope.DenyList(['b', 'c']), {'c'}
+      scope.DenyList(['a', 'b']), scope.DenyList(['b', 'c']), frozenset({'c'})
     )
     subtract_check(
       scope.DenyList(['a', 'b']),
@@ -101,6 +103,28 @@ class ScopeTest(absltest.TestCase):
       scope.DenyList({'a', 'b', 'c'}),
     )
 
+  def test_deny_list_eq_hash(self):
+    a = scope.DenyList(['a', 'b'])
+    b = scope.DenyList(('b', 'a'))
+    self.assertIsInstance(a.deny, frozenset)
+    self.assertEqual(a, b)
+    self.assertEqual(hash(a), hash(b))
+    self.assertNotEqual(a, scope.DenyList(['a']))
+
+  def test_deny_list_ordering(self):
+    a = scope.DenyList(['c', 'a'])
+    b = scope.DenyList(['b'])
+    self.assertEqual(sorted([b, 'x', a]), ['x', a, b])
+    self.assertEqual(sorted([a, 'x', b]), ['x', a, b])
+
+  def test_deny_list_repr(self):
+    self.assertEqual(
+      repr(scope.DenyList(['c', 'a', 'b'])),
+      "DenyList(deny=frozenset({'a', 'b', 'c'}))",
+    )
+    self.assertEqual(repr(scope.DenyList([])), 'DenyList(deny=frozenset())')
+    self.assertEqual(repr(scope.DenyList('a')), "DenyList(deny='a')")
+
   def test_group_collections(self):
     params = {'dense1': {'x': [10, 20]}}
     batch_stats = {'dense1': {'ema': 5}}
@@ -213,6 +237,22 @@ class ScopeTest(absltest.TestCase):
 
       jax.jit(init(f))(random.key(0))
 
+  def test_jax_leak_detector_lifted(self):
+    def g(scope, x):
+      return nn.dense(scope, x, 2)
+
+    def f(scope, x):
+      x = scope.child(g)(x)
+      return lift.vmap(
+        g, variable_axes={'params': 0}, split_rngs={'params': True}
+      )(scope.push('vmapped'), x)
+
+    # check_tracer_leaks raises if a child or lifted scope leaks a tracer.
+    with jax.check_tracer_leaks(True):
+      init_fn = jax.jit(init(f))
+      init_fn(random.key(0), jnp.ones((3, 2)))
+      init_fn(random.key(1), jnp.ones((3, 2)))
+
   def test_rng_counter_reuse(self):
     root = Scope({}, {'dropout': random.key(0)})
 
@@ -222,7 +262,9 @@ class ScopeTest(absltest.TestCase):
     a = root.child(f)()
     root = root.rewound()
     b = root.child(f)()
-    self.assertFalse(jnp.allclose(a, b))
+    self.assertFalse(
+      np.array_equal(random.key_data(a), random.key_data(b))
+    )
 
   def test_empty_col_error(self):
     root = Scope({})
@@ -287,7 +329,11 @@ class ScopeTest(absltest.TestCase):
   def test_fold_in_static_seperator(self):
     x = LazyRng(random.key(0), ('ab', 'c'))
     y = LazyRng(random.key(0), ('a', 'bc'))
-    self.assertFalse(np.all(x.as_jax_rng() == y.as_jax_rng()))
+    self.assertFalse(
+      np.array_equal(
+        random.key_data(x.as_jax_rng()), random.key_data(y.as_jax_rng())
+      )
+    )
 
 
 if __name__ == '__main__':
@@ -15,7 +15,11 @@
 """Tests for flax.errors."""
 
 from absl.testing import absltest
-from flax.errors import FlaxError, ScopeVariableNotFoundError
+from flax.errors import (
+  FlaxError,
+  ScopeParamNotFoundError,
+  ScopeVariableNotFoundError,
+)
 import pickle
 
 class ErrorrsTest(absltest.TestCase):
@@ -29,6 +33,24 @@ class ErrorrsTest(absltest.TestCase):
     self.assertIn('#flax.errors.ScopeVariableNotFoundError', str(unpicked_ex))
     self.assertNotIn('#flax.errors.FlaxError', str(unpicked_ex))
 
+  def test_lazy_exception_message(self):
+    ex = ScopeParamNotFoundError('kernel', '/dense')
+    self.assertEqual(ex.param_name, 'kernel')
+    self.assertIn('Could not find parameter named "kernel"', str(ex))
+    self.assertIn('#flax.errors.ScopeParamNotFoundError', str(ex))
+    self.assertEqual(ex.args, (str(ex),))
+    self.assertEqual(repr(ex), f'ScopeParamNotFoundError({str(ex)!r})')
+    unpicked_ex = pickle.loads(pickle.dumps(ex))
+    self.assertIsInstance(unpicked_ex, FlaxError)
+    self.assertEqual(str(unpicked_ex), str(ex))
+
+  def test_lazy_exception_args_can_be_set(self):
+    ex = ScopeParamNotFoundError('kernel', '/dense')
+    ex.args = (ex.args[0] + ' Extra context.',)
+    self.assertTrue(str(ex).endswith(' Extra context.'))
+    self.assertIn('Could not find parameter named "kernel"', str(ex))
+    self.assertEqual(ex.args, (str(ex),))
+
 
 if __name__ == '__main__':
   absltest.main()